@@ -0,0 +1,30 @@
+"""
+JSON encoding and decoding for Mimic's responses and request bodies.
+
+`orjson <https://github.com/ijl/orjson>`_ is used if it is installed;
+otherwise, the standard library's :mod:`json` is.  Either way, :func:`dumps`
+returns bytes.
+
+orjson is deliberately not a declared dependency: it only supports Python 3,
+while Mimic is tested on Python 2.6, 2.7 and PyPy, so none of the configured
+tox environments can install it.  The orjson code path is therefore not
+exercised by the test suite.
+"""
+
+from six import PY3
+
+try:
+    from orjson import dumps, loads
+except ImportError:
+    import json
+
+    loads = json.loads
+
+    if PY3:
+        def dumps(obj):
+            """
+            Encode a JSON-serializable object to bytes.
+            """
+            return json.dumps(obj).encode("ascii")
+    else:
+        dumps = json.dumps
@@ -4,6 +4,8 @@ Canned response for get auth token
 """
 from datetime import datetime, timedelta
 
+from mimic._json import dumps
+
 
 GLOBAL_MUTABLE_AUTH_STORE = {}
 GLOBAL_MUTABLE_TOKEN_STORE = {}
@@ -23,6 +25,82 @@ def format_timestamp(dt):
     return dt.strftime('%Y-%m-%dT%H:%M:%S.999-05:00')
 
 
+def format_token(tenant_id, response_token=HARD_CODED_TOKEN,
+                 timestamp=format_timestamp):
+    """
+    Canned ``token`` section of an authentication response.
+
+    :param callable timestamp: A callable, like format_timestamp, which takes a
+        datetime and returns a string.
+
+    :return: a JSON-serializable dictionary.
+    """
+    return {
+        # TODO: This token should be synthesized and stored in an
+        # auth_store-style argument, alongside impersonation tokens.
+        "id": response_token,
+        "expires": timestamp(datetime.now() + timedelta(days=1)),
+        "tenant": {
+            "id": tenant_id,
+            "name": tenant_id},
+        "RAX-AUTH:authenticatedBy": ["PASSWORD"]}
+
+
+def format_user(user_id=HARD_CODED_USER_ID, user_name=HARD_CODED_USER_NAME,
+                roles=HARD_CODED_ROLES):
+    """
+    Canned ``user`` section of an authentication response.
+
+    :return: a JSON-serializable dictionary.
+    """
+    return {
+        "id": user_id,
+        "name": user_name,
+        "roles": roles,
+    }
+
+
+def format_catalog_entry(entry, prefix_for_entry):
+    """
+    Canned service catalog entry of an authentication response.
+
+    :param entry: The :obj:`mimic.catalog.Entry` to format.
+    :param callable prefix_for_entry: A callable which takes an entry and
+        returns the URI prefix for its endpoints.
+
+    :return: a JSON-serializable dictionary.
+    """
+    return {
+        "name": entry.name,
+        "type": entry.type,
+        "endpoints": build_endpoint_dicts(entry, prefix_for_entry),
+    }
+
+
+def build_endpoint_dicts(entry, prefix_for_entry):
+    """
+    Canned endpoints of a service catalog entry of an authentication response.
+
+    This is the innermost loop of service catalog generation, so the prefix
+    for the entry is looked up only once, rather than once per endpoint.
+
+    :param entry: The :obj:`mimic.catalog.Entry` whose endpoints to format.
+    :param callable prefix_for_entry: A callable which takes an entry and
+        returns the URI prefix for its endpoints.
+
+    :return: a list of JSON-serializable dictionaries.
+    """
+    prefix = prefix_for_entry(entry)
+    return [
+        {
+            "region": endpoint.region,
+            "tenantId": endpoint.tenant_id,
+            "publicURL": endpoint.url_with_prefix(prefix),
+        }
+        for endpoint in entry.endpoints
+    ]
+
+
 def get_token(tenant_id,
               entry_generator,
               prefix_for_entry,
@@ -35,50 +113,36 @@ def get_token(tenant_id,
     Canned response for authentication, with service catalog containing
     endpoints only for services implemented by Mimic.
 
+    Each service catalog entry is serialized as soon as ``entry_generator``
+    produces it, so the response is never held as one nested dictionary; the
+    serialized pieces are joined into the body once, at the end.  The whole
+    body is built before it is returned, so if producing an entry fails, no
+    partial response is written.
+
     :param callable timestamp: A callable, like format_timestamp, which takes a
         datetime and returns a string.
     :param entry_generator: A callable, like canned_entries, which takes a
-        datetime and returns an iterable of Entry.
+        datetime and returns an iterable of Entry.  The iterable is consumed
+        once, and ``prefix_for_entry`` is only called for an entry after it has
+        been produced.
 
-    :return: a JSON-serializable dictionary matching the format of the JSON
-             response for the identity ``/v2/tokens`` request.
+    :return: the JSON response body, as bytes, for the identity
+             ``/v2/tokens`` request.
     """
-    def entry_json():
-        for entry in entry_generator(tenant_id):
-            def endpoint_json():
-                for endpoint in entry.endpoints:
-                    yield {
-                        "region": endpoint.region,
-                        "tenantId": endpoint.tenant_id,
-                        "publicURL": endpoint.url_with_prefix(
-                            prefix_for_entry(entry)
-                        ),
-                    }
-            yield {
-                "name": entry.name,
-                "type": entry.type,
-                "endpoints": list(endpoint_json())
-            }
-
-    return {
-        "access": {
-            "token": {
-                # TODO: This token should be synthesized and stored in an
-                # auth_store-style argument, alongside impersonation tokens.
-                "id": response_token,
-                "expires": timestamp(datetime.now() + timedelta(days=1)),
-                "tenant": {
-                    "id": tenant_id,
-                    "name": tenant_id},
-                "RAX-AUTH:authenticatedBy": ["PASSWORD"]},
-            "serviceCatalog": list(entry_json()),
-            "user": {
-                "id": response_user_id,
-                "name": response_user_name,
-                "roles": response_roles,
-            }
-        }
-    }
+    parts = [
+        b'{"access":{"token":',
+        dumps(format_token(tenant_id, response_token, timestamp)),
+        b',"serviceCatalog":[',
+    ]
+    for index, entry in enumerate(entry_generator(tenant_id)):
+        if index:
+            parts.append(b",")
+        parts.append(dumps(format_catalog_entry(entry, prefix_for_entry)))
+    parts.append(b'],"user":')
+    parts.append(dumps(format_user(response_user_id, response_user_name,
+                                   response_roles)))
+    parts.append(b'}}')
+    return b"".join(parts)
 
 
 def get_endpoints(tenant_id, entry_generator, prefix_for_entry):
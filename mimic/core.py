@@ -120,9 +120,10 @@ class MimicCore(object):
 
         :raise: :obj:`KeyError` if no such thing exists.
         """
-        if token in self._token_to_session:
+        try:
             return self._token_to_session[token]
-        return self._new_session(token=token)
+        except KeyError:
+            return self._new_session(token=token)
 
     def session_for_api_key(self, username, api_key):
         """
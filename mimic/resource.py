@@ -2,13 +2,23 @@
 Resources for Mimic's core.
 """
 
-import json
-
 from twisted.web.resource import NoResource
 
+from mimic._json import dumps
+
 from mimic.canned_responses.mimic_presets import get_presets
 from mimic.rest.mimicapp import MimicApp
 from mimic.rest.auth_api import AuthApi, base_uri_from_request
+from mimic.util.helper import json_response
+
+# The presets never change, so they only need to be serialized once.
+_PRESETS_JSON = dumps(get_presets)
+
+# NoResource renders the same 404 page for every request, so one will do.
+_NO_RESOURCE = NoResource()
+
+_HELP_BODY = (b"To get started with Mimic, POST an authentication request to:"
+              b"\n\n/identity/v2.0/tokens")
 
 
 class MimicRoot(object):
@@ -24,44 +34,55 @@ class MimicRoot(object):
             from.
         """
         self.core = core
+        self._auth_api_resource = AuthApi(core).app.resource()
 
     @app.route("/", methods=["GET"])
     def help(self, request):
         """
         A helpful greeting message.
         """
-        request.responseHeaders.setRawHeaders("content-type", ["text/plain"])
-        return ("To get started with Mimic, POST an authentication request to:"
-                "\n\n/identity/v2.0/tokens")
+        request.responseHeaders.setRawHeaders(b"content-type", [b"text/plain"])
+        return _HELP_BODY
 
     @app.route("/identity", branch=True)
     def get_auth_api(self, request):
         """
         Get the identity ...
+
+        The resource is built once, when this :obj:`MimicRoot` is created,
+        since it does not depend on the request.
         """
-        return AuthApi(self.core).app.resource()
+        return self._auth_api_resource
 
     @app.route('/mimic/v1.0/presets', methods=['GET'])
+    @json_response
     def get_mimic_presets(self, request):
         """
         Return the preset values for mimic
         """
         request.setResponseCode(200)
-        return json.dumps(get_presets)
+        return _PRESETS_JSON
 
-    @app.route("/service/<string:region_name>/<string:service_id>",
-               branch=True)
-    def get_service_resource(self, request, region_name, service_id):
+    @app.route("/service", branch=True)
+    def get_service_resource(self, request):
         """
         Based on the URL prefix of a region and a service, where the region is
         an identifier (like ORD, DFW, etc) and service is a
         dynamically-generated UUID for a particular plugin, retrieve the
         resource associated with that service.
+
+        The region and service are the first two segments after ``/service``;
+        they are looked up directly rather than being matched by a route.
         """
+        if len(request.postpath) < 2:
+            return _NO_RESOURCE
+        region_name, service_id = request.postpath[:2]
         serviceObject = self.core.service_with_region(
             region_name, service_id, base_uri_from_request(request))
 
         if serviceObject is None:
             # workaround for https://github.com/twisted/klein/issues/56
-            return NoResource()
+            return _NO_RESOURCE
+        request.prepath.extend(request.postpath[:2])
+        request.postpath = request.postpath[2:]
         return serviceObject
@@ -3,15 +3,12 @@
 Defines get token, impersonation
 """
 
-import json
-
-from twisted.web.server import Request
 from twisted.python.urlpath import URLPath
-from mimic.canned_responses.auth import get_token, get_endpoints
+from mimic.canned_responses.auth import get_endpoints, get_token
 from mimic.rest.mimicapp import MimicApp
+from mimic._json import dumps
 from mimic.canned_responses.auth import format_timestamp
-
-Request.defaultContentType = 'application/json'
+from mimic.util.helper import json_body, json_response
 
 
 class AuthApi(object):
@@ -29,12 +26,14 @@ class AuthApi(object):
         self.core = core
 
     @app.route('/v2.0/tokens', methods=['POST'])
-    def get_token_and_service_catalog(self, request):
+    @json_response
+    @json_body
+    def get_token_and_service_catalog(self, request, content):
         """
         Return a service catalog consisting of nova and load balancer mocked
         endpoints and an api token.
         """
-        content = json.loads(request.content.read())
+        base_uri = base_uri_from_request(request)
         # tenant_id = content['auth'].get('tenantName', None)
         credentials = content['auth']['passwordCredentials']
         session = self.core.session_for_username_password(
@@ -45,23 +44,18 @@ class AuthApi(object):
         prefix_map = {
             # map of entry to URI prefix for that entry
         }
-
-        def lookup(entry):
-            return prefix_map[entry]
-        return json.dumps(
-            get_token(
-                session.tenant_id,
-                entry_generator=lambda tenant_id:
-                list(self.core.entries_for_tenant(
-                    tenant_id, prefix_map, base_uri_from_request(request))),
-                prefix_for_entry=lookup,
-                response_token=session.token,
-                response_user_id=session.user_id,
-                response_user_name=session.username,
-            )
+        return get_token(
+            session.tenant_id,
+            entry_generator=lambda tenant_id:
+            self.core.entries_for_tenant(tenant_id, prefix_map, base_uri),
+            prefix_for_entry=prefix_map.__getitem__,
+            response_token=session.token,
+            response_user_id=session.user_id,
+            response_user_name=session.username,
         )
 
     @app.route('/v1.1/mosso/<string:tenant_id>', methods=['GET'])
+    @json_response
     def get_username(self, request, tenant_id):
         """
         Returns response with random usernames.
@@ -69,40 +63,42 @@ class AuthApi(object):
         # FIXME: TEST
         request.setResponseCode(301)
         session = self.core.session_for_tenant_id(tenant_id)
-        return json.dumps(dict(user=dict(id=session.username)))
+        return dumps(dict(user=dict(id=session.username)))
 
     @app.route('/v2.0/RAX-AUTH/impersonation-tokens', methods=['POST'])
-    def get_impersonation_token(self, request):
+    @json_response
+    @json_body
+    def get_impersonation_token(self, request, content):
         """
         Return a token id with expiration.
         """
         # FIXME: TEST
         request.setResponseCode(200)
-        content = json.loads(request.content.read())
         expires_in = content['RAX-AUTH:impersonation']['expire-in-seconds']
         username = content['RAX-AUTH:impersonation']['user']['username']
 
         session = self.core.session_for_impersonation(username, expires_in)
-        return json.dumps({"access": {
+        return dumps({"access": {
             "token": {"id": session.token,
                       "expires": format_timestamp(session.expires)}
         }})
 
     @app.route('/v2.0/tokens/<string:token_id>/endpoints', methods=['GET'])
+    @json_response
     def get_endpoints_for_token(self, request, token_id):
         """
         Return a service catalog consisting of nova and load balancer mocked
         endpoints.
         """
         # FIXME: TEST
+        base_uri = base_uri_from_request(request)
         request.setResponseCode(200)
         prefix_map = {}
         session = self.core.session_for_token(token_id)
-        return json.dumps(get_endpoints(
+        return dumps(get_endpoints(
             session.tenant_id,
-            entry_generator=lambda tenant_id: list(
-                self.core.entries_for_tenant(tenant_id, prefix_map,
-                                             base_uri_from_request(request))),
+            entry_generator=lambda tenant_id:
+            self.core.entries_for_tenant(tenant_id, prefix_map, base_uri),
             prefix_for_entry=prefix_map.get)
         )
 
@@ -111,10 +107,18 @@ def base_uri_from_request(request):
     """
     Given a request, return the base URI of the request
 
+    The result is cached on the request, so calling this more than once per
+    request is cheap.
+
     :param request: a twisted HTTP request
     :type request: :class:`twisted.web.http.Request`
 
     :return: the base uri the request was trying to access
     :rtype: ``str``
     """
-    return str(URLPath.fromRequest(request).click('/'))
+    cached = getattr(request, '_mimic_base_uri', None)
+    if cached is not None:
+        return cached
+    base_uri = str(URLPath.fromRequest(request).click('/'))
+    request._mimic_base_uri = base_uri
+    return base_uri
@@ -3,13 +3,10 @@ Defines the GET api call to the mimic api to fetch the presets
 TO DO: SHould alos be able to chnage the presets using a PUT request
 """
 
-import json
-from twisted.web.server import Request
 from mimic.canned_responses.mimic_presets import get_presets
 from mimic.rest.mimicapp import MimicApp
-
-
-Request.defaultContentType = 'application/json'
+from mimic._json import dumps
+from mimic.util.helper import json_response
 
 
 class MimicPresetApi(object):
@@ -20,9 +17,10 @@ class MimicPresetApi(object):
     app = MimicApp()
 
     @app.route('/v1.0/mimic/presets', methods=['GET'])
+    @json_response
     def get_mimic_presets(self, request):
         """
         Return the preset values for mimic
         """
         request.setResponseCode(200)
-        return json.dumps(get_presets)
+        return dumps(get_presets)
@@ -3,26 +3,23 @@ Defines create, delete, get, list servers and get images and flavors.
 """
 
 from uuid import uuid4
-import json
 from random import randrange
 
 from six import text_type
 
 from zope.interface import implementer
 
-from twisted.web.server import Request
-
 from twisted.plugin import IPlugin
 
 from mimic.canned_responses.nova import (get_server, list_server, get_limit,
                                          create_server, delete_server,
                                          get_image, get_flavor, list_addresses)
 from mimic.rest.mimicapp import MimicApp
+from mimic._json import dumps
 from mimic.catalog import Entry
 from mimic.catalog import Endpoint
 from mimic.imimic import IAPIMock
-
-Request.defaultContentType = 'application/json'
+from mimic.util.helper import json_body, json_response
 
 
 @implementer(IAPIMock, IPlugin)
@@ -61,7 +58,7 @@ def _list_servers(request, tenant_id, details=False):
         server_name = request.args['name'][0]
     response_data = list_server(tenant_id, server_name, details=details)
     request.setResponseCode(response_data[1])
-    return json.dumps(response_data[0])
+    return dumps(response_data[0])
 
 
 class NovaRegion(object):
@@ -79,27 +76,30 @@ class NovaRegion(object):
     app = MimicApp()
 
     @app.route('/v2/<string:tenant_id>/servers', methods=['POST'])
-    def create_server(self, request, tenant_id):
+    @json_response
+    @json_body
+    def create_server(self, request, tenant_id, content):
         """
         Returns a generic create server response, with status 'ACTIVE'.
         """
         server_id = 'test-server{0}-id-{0}'.format(str(randrange(9999999999)))
-        content = json.loads(request.content.read())
         response_data = create_server(tenant_id, content['server'], server_id,
                                       self.uri_prefix)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
 
     @app.route('/v2/<string:tenant_id>/servers/<string:server_id>', methods=['GET'])
+    @json_response
     def get_server(self, request, tenant_id, server_id):
         """
         Returns a generic get server response, with status 'ACTIVE'
         """
         response_data = get_server(server_id)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
 
     @app.route('/v2/<string:tenant_id>/servers', methods=['GET'])
+    @json_response
     def list_servers(self, request, tenant_id):
         """
         Returns list of servers that were created by the mocks, with the given name.
@@ -107,6 +107,7 @@ class NovaRegion(object):
         return _list_servers(request, tenant_id)
 
     @app.route('/v2/<string:tenant_id>/servers/detail', methods=['GET'])
+    @json_response
     def list_servers_with_details(self, request, tenant_id):
         """
         Returns list of servers that were created by the mocks, with details such as the metadata.
@@ -114,41 +115,46 @@ class NovaRegion(object):
         return _list_servers(request, tenant_id, details=True)
 
     @app.route('/v2/<string:tenant_id>/servers/<string:server_id>', methods=['DELETE'])
+    @json_response
     def delete_server(self, request, tenant_id, server_id):
         """
         Returns a 204 response code, for any server id'
         """
         response_data = delete_server(server_id)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
 
     @app.route('/v2/<string:tenant_id>/images/<string:image_id>', methods=['GET'])
+    @json_response
     def get_image(self, request, tenant_id, image_id):
         """
         Returns a get image response, for any given imageid
         """
         response_data = get_image(image_id)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
 
     @app.route('/v2/<string:tenant_id>/flavors/<string:flavor_id>', methods=['GET'])
+    @json_response
     def get_flavor(self, request, tenant_id, flavor_id):
         """
         Returns a get flavor response, for any given flavorid
         """
         response_data = get_flavor(flavor_id)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
 
     @app.route('/v2/<string:tenant_id>/limits', methods=['GET'])
+    @json_response
     def get_limit(self, request, tenant_id):
         """
         Returns a get flavor response, for any given flavorid
         """
         request.setResponseCode(200)
-        return json.dumps(get_limit())
+        return dumps(get_limit())
 
     @app.route('/v2/<string:tenant_id>/servers/<string:server_id>/ips', methods=['GET'])
+    @json_response
     def get_ips(self, request, tenant_id, server_id):
         """
         Returns a get flavor response, for any given flavorid.
@@ -156,4 +162,4 @@ class NovaRegion(object):
         """
         response_data = list_addresses(server_id)
         request.setResponseCode(response_data[1])
-        return json.dumps(response_data[0])
+        return dumps(response_data[0])
@@ -1,34 +1,46 @@
+import json
+
 from twisted.trial.unittest import SynchronousTestCase
 from twisted.internet.task import Clock
+from twisted.web.test.requesthelper import DummyRequest
 
+from mimic.catalog import Endpoint, Entry
 from mimic.core import MimicCore
 from mimic.resource import MimicRoot
 from mimic.canned_responses.auth import (
     get_token, HARD_CODED_TOKEN, HARD_CODED_USER_ID,
     HARD_CODED_USER_NAME, HARD_CODED_ROLES,
-    get_endpoints
+    get_endpoints, build_endpoint_dicts
 )
+from mimic.rest.auth_api import base_uri_from_request
 from mimic.test.dummy import ExampleAPI
-from mimic.test.helpers import request, json_request
+from mimic.util.helper import MAX_BODY_SIZE
+from mimic.test.helpers import request, json_request, request_with_content
 
 
 class ExampleCatalogEndpoint(object):
+    __slots__ = ('_tenant', '_num', 'endpoint_id',
+                 '_region', '_tenant_id', '_url')
+
     def __init__(self, tenant, num, endpoint_id):
         self._tenant = tenant
         self._num = num
         self.endpoint_id = endpoint_id
+        # These never change, so only format them once.
+        self._region = "EXAMPLE_%d" % (num,)
+        self._tenant_id = "%s_%d" % (tenant, num)
+        self._url = "http://ok_%d" % (num,)
 
     @property
     def region(self):
-        return "EXAMPLE_{num}".format(num=self._num)
+        return self._region
 
     @property
     def tenant_id(self):
-        return "{tenant}_{num}".format(tenant=self._tenant,
-                                       num=self._num)
+        return self._tenant_id
 
     def url_with_prefix(self, prefix):
-        return "http://ok_{num}".format(num=self._num)
+        return self._url
 
 
 class ExampleCatalogEntry(object):
@@ -37,6 +49,8 @@ class ExampleCatalogEntry(object):
     maybe you have to pass it a tenant ID to get one of these.  (Services which
     don't want to show up in the catalog won't produce these.)
     """
+    __slots__ = ('name', 'type', 'path_prefix', 'endpoints')
+
     def __init__(self, tenant_id, name, endpoint_count=2, idgen=lambda: 1):
         # some services transform their tenant ID
         self.name = name
@@ -46,6 +60,17 @@ class ExampleCatalogEntry(object):
                           for n in range(endpoint_count)]
 
 
+class BrokenCatalogAPI(ExampleAPI):
+    """
+    An API whose catalog entries can be registered with a core, but which
+    fail to be produced for any particular tenant.
+    """
+    def catalog_entries(self, tenant_id):
+        if tenant_id is None:
+            return ExampleAPI.catalog_entries(self, tenant_id)
+        raise RuntimeError("no catalog for you")
+
+
 def example_endpoints(counter):
     """
     Create some example catalog entries from a given tenant ID, like the plugin
@@ -70,17 +95,17 @@ class CatalogGenerationTests(SynchronousTestCase):
 
     def test_tokens_response(self):
         """
-        :func:`get_token` returns JSON-serializable data in the format
-        presented by a ``POST /v2.0/tokens`` API request; i.e. the normal
-        user-facing service catalog generation.
+        :func:`get_token` returns JSON in the format presented by a
+        ``POST /v2.0/tokens`` API request; i.e. the normal user-facing service
+        catalog generation.
         """
         tenant_id = 'abcdefg'
         self.assertEqual(
-            get_token(
+            json.loads(get_token(
                 tenant_id=tenant_id, timestamp=lambda dt: "<<<timestamp>>>",
                 entry_generator=example_endpoints(lambda: 1),
                 prefix_for_entry=lambda e: 'prefix'
-            ),
+            )),
             {
                 "access": {
                     "token": {
@@ -137,6 +162,64 @@ class CatalogGenerationTests(SynchronousTestCase):
             }
         )
 
+    def test_endpoint_dicts(self):
+        """
+        :func:`build_endpoint_dicts` formats each of an entry's endpoints with
+        the entry's prefix, looking the prefix up only once.
+        """
+        entry = Entry('abcdefg', "compute", "something", [
+            Endpoint('abcdefg', "ORD", "1", prefix="v2"),
+            Endpoint('abcdefg', "DFW", "2", prefix="v2"),
+        ])
+        looked_up = []
+
+        def prefix_for_entry(e):
+            looked_up.append(e)
+            return 'http://prefix/'
+
+        self.assertEqual(
+            [
+                {
+                    "region": "ORD",
+                    "tenantId": "abcdefg",
+                    "publicURL": "http://prefix/v2/abcdefg",
+                },
+                {
+                    "region": "DFW",
+                    "tenantId": "abcdefg",
+                    "publicURL": "http://prefix/v2/abcdefg",
+                },
+            ],
+            build_endpoint_dicts(entry, prefix_for_entry))
+        self.assertEqual([entry], looked_up)
+
+    def test_tokens_response_consumes_entries_lazily(self):
+        """
+        :func:`get_token` iterates the entries from ``entry_generator`` once,
+        and only looks up the prefix for an entry after it has been produced.
+        """
+        tenant_id = 'abcdefg'
+        consumed = []
+
+        def entries(tenant_id):
+            for entry in example_endpoints(lambda: 1)(tenant_id):
+                consumed.append(entry)
+                yield entry
+
+        def prefix_for_entry(entry):
+            self.assertIn(entry, consumed)
+            return 'prefix'
+
+        body = get_token(tenant_id=tenant_id,
+                         timestamp=lambda dt: "<<<timestamp>>>",
+                         entry_generator=entries,
+                         prefix_for_entry=prefix_for_entry)
+        self.assertEqual(2, len(consumed))
+        self.assertEqual(
+            ["something", "something_else"],
+            [entry["name"]
+             for entry in json.loads(body)["access"]["serviceCatalog"]])
+
     def test_endpoints_response(self):
         """
         :func:`get_endpoints` returns JSON-serializable data in the format
@@ -229,6 +312,8 @@ class GetAuthTokenAPITests(SynchronousTestCase):
         ))
 
         self.assertEqual(200, response.code)
+        self.assertEqual(['application/json'],
+                         response.headers.getRawHeaders('content-type'))
         token = json_body['access']['token']['id']
         tenant_id = json_body['access']['token']['tenant']['id']
         session = core.session_for_token(token)
@@ -264,6 +349,55 @@ class GetAuthTokenAPITests(SynchronousTestCase):
         self.assertEqual(token, session.token)
         self.assertEqual("turtlepower", session.tenant_id)
 
+    def test_oversized_body_rejected(self):
+        """
+        A request body larger than
+        :obj:`mimic.util.helper.MAX_BODY_SIZE` is rejected with a 413, and
+        no session is created for it.
+        """
+        core = MimicCore(Clock(), [])
+        root = MimicRoot(core).app.resource()
+
+        (response, json_body) = self.successResultOf(json_request(
+            self, root, "POST", "/identity/v2.0/tokens",
+            {
+                "auth": {
+                    "passwordCredentials": {
+                        "username": "demoauthor",
+                        "password": "x" * MAX_BODY_SIZE
+                    }
+                }
+            }
+        ))
+
+        self.assertEqual(413, response.code)
+        self.assertEqual(413, json_body['code'])
+        self.assertEqual({}, core._username_to_token)
+
+    def test_catalog_failure_is_clean_error(self):
+        """
+        If producing the service catalog fails, the response is a 500 error,
+        rather than a successful response with a truncated body.
+        """
+        core = MimicCore(Clock(), [BrokenCatalogAPI()])
+        root = MimicRoot(core).app.resource()
+
+        (response, content) = self.successResultOf(request_with_content(
+            self, root, "POST", "/identity/v2.0/tokens",
+            json.dumps({
+                "auth": {
+                    "passwordCredentials": {
+                        "username": "demoauthor",
+                        "password": "theUsersPassword"
+                    }
+                }
+            })
+        ))
+
+        self.assertEqual(500, response.code)
+        self.assertNotIn('"access"', content)
+        self.assertTrue(self.flushLoggedErrors(RuntimeError))
+
     def test_response_service_catalog_has_base_uri(self):
         """
         The JSON response's service catalog whose endpoints all begin with
@@ -334,9 +468,34 @@ class GetEndpointsForTokenTests(SynchronousTestCase):
         ))
 
         self.assertEqual(200, response.code)
+        self.assertEqual(['application/json'],
+                         response.headers.getRawHeaders('content-type'))
         urls = [endpoint['publicURL'] for endpoint in json_body['endpoints']]
         self.assertEqual(1, len(urls))
 
         self.assertTrue(
             urls[0].startswith('http://mybase/'),
             '{0} does not start with "http://mybase"'.format(urls[0]))
+
+
+class BaseURIFromRequestTests(SynchronousTestCase):
+    """
+    Tests for :func:`mimic.rest.auth_api.base_uri_from_request`.
+    """
+
+    def test_base_uri_cached_on_request(self):
+        """
+        The base URI is computed from the request's URL only once per
+        request.
+        """
+        urls_requested = []
+        request = DummyRequest([])
+
+        def prePathURL():
+            urls_requested.append(True)
+            return 'http://mybase/identity/v2.0/tokens'
+        request.prePathURL = prePathURL
+
+        self.assertEqual('http://mybase/', base_uri_from_request(request))
+        self.assertEqual('http://mybase/', base_uri_from_request(request))
+        self.assertEqual(1, len(urls_requested))
@@ -0,0 +1,99 @@
+import json
+import treq
+
+from twisted.trial.unittest import SynchronousTestCase
+from twisted.internet.task import Clock
+
+from mimic.canned_responses.mimic_presets import get_presets
+from mimic.core import MimicCore
+from mimic.resource import MimicRoot
+from mimic.test.helpers import json_request, request
+from mimic.rest.loadbalancer_api import LoadBalancerApi
+from mimic.util.helper import MAX_BODY_SIZE
+
+
+class LoadbalancerAPITests(SynchronousTestCase):
+
+    """
+    Tests for the Loadbalancer plugin api
+    """
+
+    def setUp(self):
+        """
+        Create a :obj:`MimicCore` with :obj:`LoadBalancerApi` as the only
+        plugin, and authenticate to find its URI.
+        """
+        self.core = MimicCore(Clock(), [LoadBalancerApi()])
+        self.root = MimicRoot(self.core).app.resource()
+        self.response = request(
+            self, self.root, "POST", "/identity/v2.0/tokens",
+            json.dumps({
+                "auth": {
+                    "passwordCredentials": {
+                        "username": "test1",
+                        "password": "test1password",
+                    },
+                }
+            })
+        )
+        self.auth_response = self.successResultOf(self.response)
+        self.json_body = self.successResultOf(
+            treq.json_content(self.auth_response))
+        self.uri = self.json_body['access']['serviceCatalog'][0]['endpoints'][0]['publicURL']
+
+    def test_add_load_balancer(self):
+        """
+        Test to verify :func:`add_load_balancer` on
+        ``POST /v2.0/<tenant_id>/loadbalancers``
+        """
+        (response, json_body) = self.successResultOf(json_request(
+            self, self.root, "POST", self.uri + '/loadbalancers',
+            {"loadBalancer": {"name": "test_lb", "protocol": "HTTP"}}))
+        self.assertEqual(202, response.code)
+        self.assertEqual("test_lb", json_body['loadBalancer']['name'])
+
+    def test_add_load_balancer_oversized_body(self):
+        """
+        :func:`add_load_balancer` responds with a 413 when the request body is
+        larger than :obj:`mimic.util.helper.MAX_BODY_SIZE`.
+        """
+        (response, json_body) = self.successResultOf(json_request(
+            self, self.root, "POST", self.uri + '/loadbalancers',
+            {"loadBalancer": {"name": "x" * MAX_BODY_SIZE,
+                              "protocol": "HTTP"}}))
+        self.assertEqual(413, response.code)
+        self.assertEqual(413, json_body['code'])
+
+    def test_add_node_to_nonexistent_load_balancer(self):
+        """
+        Test to verify :func:`add_node_to_load_balancer` on
+        ``POST /v2.0/<tenant_id>/loadbalancers/<lb_id>/nodes``, when the load
+        balancer does not exist.
+        """
+        (response, json_body) = self.successResultOf(json_request(
+            self, self.root, "POST", self.uri + '/loadbalancers/1/nodes',
+            {"nodes": [{"address": "127.0.0.1", "port": 80}]}))
+        self.assertEqual(404, response.code)
+
+    def test_add_node_to_invalid_load_balancer(self):
+        """
+        :func:`add_node_to_load_balancer` responds with a 404 for the preset
+        invalid load balancer, without reading the request body.
+        """
+        response = self.successResultOf(request(
+            self, self.root, "POST",
+            self.uri + '/loadbalancers/{0}/nodes'.format(
+                get_presets['loadbalancers']['invalid_lb']),
+            b""))
+        self.assertEqual(404, response.code)
+
+    def test_add_node_oversized_body(self):
+        """
+        :func:`add_node_to_load_balancer` responds with a 413 when the request
+        body is larger than :obj:`mimic.util.helper.MAX_BODY_SIZE`.
+        """
+        (response, json_body) = self.successResultOf(json_request(
+            self, self.root, "POST", self.uri + '/loadbalancers/1/nodes',
+            {"nodes": [{"address": "x" * MAX_BODY_SIZE, "port": 80}]}))
+        self.assertEqual(413, response.code)
+        self.assertEqual(413, json_body['code'])
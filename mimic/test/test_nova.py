@@ -12,6 +12,7 @@ from mimic.core import MimicCore
 from mimic.resource import MimicRoot
 from mimic.test.helpers import json_request, request
 from mimic.rest.nova_api import NovaApi
+from mimic.util.helper import MAX_BODY_SIZE
 
 
 class ResponseGenerationTests(SynchronousTestCase):
@@ -173,6 +174,23 @@ class NovaAPITests(SynchronousTestCase):
         self.assertEqual(self.create_server_response.code, 202)
         self.assertTrue(type(self.server_id), unicode)
 
+    def test_create_server_oversized_body(self):
+        """
+        :func:`create_server` responds with a 413 when the request body is
+        larger than :obj:`mimic.util.helper.MAX_BODY_SIZE`.
+        """
+        (response, json_body) = self.successResultOf(json_request(
+            self, self.root, "POST", self.uri + '/servers',
+            {
+                "server": {
+                    "name": "x" * MAX_BODY_SIZE,
+                    "imageRef": "test-image",
+                    "flavorRef": "test-flavor"
+                }
+            }))
+        self.assertEqual(413, response.code)
+        self.assertEqual(413, json_body['code'])
+
     def test_list_servers(self):
         """
         Test to verify :func:`list_servers` on ``GET /v2.0/<tenant_id>/servers``
@@ -1,5 +1,6 @@
 from twisted.internet.task import Clock
 from twisted.trial.unittest import SynchronousTestCase
+from twisted.web.server import Request
 
 from mimic.canned_responses.mimic_presets import get_presets
 from mimic.core import MimicCore
@@ -79,6 +80,25 @@ class ServiceResourceTests(SynchronousTestCase):
         self.assertEqual(404, response.code)
         self.assertEqual([], example.store.keys())
 
+    def test_service_endpoint_returns_404_if_no_service_id(self):
+        """
+        When the URI used to access a service has only a region, a 404 is
+        returned and the resource for the service is not accessed.
+        """
+        example = ExampleAPI()
+
+        core = MimicCore(Clock(), [example])
+        root = MimicRoot(core).app.resource()
+
+        # get the region and service id registered for the example API
+        (region, service_id) = core.uri_prefixes.keys()[0]
+
+        response = self.successResultOf(request(
+            self, root, "GET", "http://mybase/service/{0}".format(region)
+        ))
+        self.assertEqual(404, response.code)
+        self.assertEqual([], example.store.keys())
+
     def test_service_endpoint_returns_service_resource(self):
         """
         When the URI used to access a real service has the right service ID
@@ -137,3 +157,19 @@ class RootAndPresetTests(SynchronousTestCase):
         self.assertEqual(['application/json'],
                          response.headers.getRawHeaders('content-type'))
         self.assertEqual(get_presets, json_content)
+
+
+class DefaultContentTypeTests(SynchronousTestCase):
+    """
+    Tests for the content type of responses which don't set one.
+    """
+    def test_default_content_type_unchanged(self):
+        """
+        Importing Mimic's APIs does not change the default content type of
+        every response in the process.
+        """
+        from mimic.rest import (auth_api, loadbalancer_api, mimic_api,
+                                nova_api)
+        for module in (auth_api, loadbalancer_api, mimic_api, nova_api):
+            self.assertEqual("text/html", Request.defaultContentType,
+                             "{0} changed the default".format(module.__name__))
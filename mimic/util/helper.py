@@ -3,10 +3,88 @@
 Helper methods
 """
 from datetime import datetime, timedelta
+from functools import wraps
+
+from mimic._json import dumps, loads
 
 
 fmt = '%Y-%m-%dT%H:%M:%S.%fZ'
 
+#: The largest request body, in bytes, that :func:`read_json_body` will parse.
+MAX_BODY_SIZE = 65536
+
+
+class RequestBodyTooLarge(ValueError):
+    """
+    A request body was larger than the size allowed for it.
+    """
+
+
+def read_json_body(request, max_bytes=MAX_BODY_SIZE, chunk_size=4096):
+    """
+    Read and parse the JSON body of the given request, ``chunk_size`` bytes at
+    a time, giving up as soon as more than ``max_bytes`` have been read.
+
+    :param request: a twisted HTTP request
+    :type request: :class:`twisted.web.http.Request`
+
+    :raise: :obj:`RequestBodyTooLarge` if the body is larger than
+        ``max_bytes``, or :obj:`ValueError` if it is not valid JSON.
+    """
+    body = bytearray()
+    while True:
+        chunk = request.content.read(chunk_size)
+        if not chunk:
+            break
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise RequestBodyTooLarge(max_bytes)
+    return loads(bytes(body))
+
+
+def json_response(handler):
+    """
+    Decorate a Klein route method so that its response is labelled as JSON.
+
+    This is done per response, rather than by setting the process-wide
+    ``twisted.web.server.Request.defaultContentType``, so that other resources
+    in the same process are unaffected.
+    """
+    @wraps(handler)
+    def set_content_type(self, request, *args, **kwargs):
+        request.responseHeaders.setRawHeaders(b"content-type",
+                                              [b"application/json"])
+        return handler(self, request, *args, **kwargs)
+    return set_content_type
+
+
+def request_body_too_large(request):
+    """
+    Respond to a request whose body was larger than :obj:`MAX_BODY_SIZE`.
+
+    :return: the encoded 413 response body.
+    """
+    request.setResponseCode(413)
+    return dumps(invalid_resource("Request body too large", 413))
+
+
+def json_body(handler):
+    """
+    Decorate a Klein route method so that it is called with the parsed JSON
+    body of its request as the ``content`` keyword argument.
+
+    If the body is larger than :obj:`MAX_BODY_SIZE`, the method is not called,
+    and the response is a 413 instead.
+    """
+    @wraps(handler)
+    def parse_body(self, request, *args, **kwargs):
+        try:
+            kwargs['content'] = read_json_body(request)
+        except RequestBodyTooLarge:
+            return request_body_too_large(request)
+        return handler(self, request, *args, **kwargs)
+    return parse_body
+
 
 def not_found_response(resource='servers'):
     """